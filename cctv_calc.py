@@ -8,27 +8,18 @@ HDD pricing, auto/manual calculation, report export to Excel and PDF.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import math, itertools, json, os, sys
+from array import array
+from bisect import bisect_right
 from datetime import datetime
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import threading
 
-# Try to import xlwings for Excel export
-try:
-    import xlwings as xw
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
-
-# Try to import reportlab for PDF export
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter, landscape
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# Optional export backends. Only probe availability here; the actual imports
+# are deferred into the export handlers so app startup never pays for loading
+# xlwings or reportlab.
+from importlib.util import find_spec
+EXCEL_AVAILABLE = find_spec("xlwings") is not None
+PDF_AVAILABLE = find_spec("reportlab") is not None
 
 # ─────────────────────────── Persistence ───────────────────────────────────
 DATA_FILE = "system_data.json"
@@ -79,24 +70,76 @@ FONT_MONO = ("Consolas", 9)
 FONT_BTN  = ("Segoe UI", 9, "bold")
 FONT_LRGE = ("Segoe UI", 11, "bold")
 
-# ================= OPTIMIZED HDD CACHE =================
-hdd_cache = {}
+# Button style palette: (bg, fg, active bg)
+BTN_COLORS = {
+    "primary": (ACCENT,   "#000000", ACCENT_D),
+    "danger":  (SURFACE2, RED,       SURFACE3),
+    "ghost":   (SURFACE2, TEXT2,     SURFACE3),
+    "success": (GREEN,    "#000000", "#18a87f"),
+    "normal":  (SURFACE3, TEXT,      BORDER),
+}
 
-def get_best_hdd_cached(required_tb, slots, parity, price_dict):
-    """Cached HDD calculation - critical for performance"""
-    key = (round(required_tb, 2), slots, parity)
-    if key in hdd_cache:
-        return hdd_cache[key]
+# ─────────────────────────── Static Text ───────────────────────────────────
+SEP72 = "=" * 72 + "\n"
+DASH50 = "-" * 50 + "\n"
+
+NVR_FIELD_LABELS = {
+    "Name": "Name", "SKU": "SKU", "CH": "Channels",
+    "MB": "Max MB/s", "Slots": "HDD Slots", "Price": "Price",
+}
+
+NO_SOLUTION_MSG = (
+    "ERROR: No valid configuration found.\n\n"
+    "Possible reasons:\n"
+    "• HDD sizes cannot meet storage requirements\n"
+    "• NVR channel/slot limits exceeded\n"
+    "• No compatible NVRs available for selected RAID mode"
+)
+
+EXPORT_FIRST_MSG = "Run a calculation first before exporting!"
+PDF_MISSING_MSG = (
+    "PDF export requires reportlab library.\n\n"
+    "Please install it using:\npip install reportlab"
+)
+EXCEL_MISSING_MSG = "Excel export requires xlwings.\nInstall: pip install xlwings"
 
+# Parity drives per RAID level (anything unknown is treated as RAID 6)
+RAID_PARITY = {"JBOD": 0, "RAID 5": 1, "RAID 6": 2}
+
+# ================= OPTIMIZED HDD CACHE =================
+hdd_cache = {}
+hdd_pairs_cache = {}
+dominance_cache = {}
+
+def _price_pairs_sorted(price_dict):
+    """Flatten a price dict to (cap, price) pairs sorted by price, cached per
+    table contents so the sort happens once, not once per HDD lookup."""
+    key = tuple(price_dict.items())
+    pairs = hdd_pairs_cache.get(key)
+    if pairs is None:
+        pairs = tuple(sorted(key, key=lambda cp: cp[1]))
+        hdd_pairs_cache[key] = pairs
+    return pairs
+
+def _search_hdd_config(required_tb, slots, parity, cap_price_pairs):
+    """Pure-arithmetic kernel: cheapest drive config for the given load.
+
+    Takes the prices as a flat (cap, price) sequence sorted by ascending
+    price, so the hot loop does no dict traversal - only integer/float work
+    on locals - and can stop as soon as no remaining price can win.
+    """
+    min_drives = parity + 1 if parity else 1
     best_cost, best_cfg = float('inf'), None
-    for cap, price in price_dict.items():
+    for cap, price in cap_price_pairs:
+        if price * min_drives >= best_cost:
+            break
         if cap <= 0:
             continue
 
         drives_needed = math.ceil(required_tb / cap)
         if parity > 0:
             drives_needed += parity
-        
+
         if drives_needed > slots:
             continue
 
@@ -113,28 +156,48 @@ def get_best_hdd_cached(required_tb, slots, parity, price_dict):
                 "total_capacity": drives_needed * cap
             }
 
+    return best_cfg
+
+def get_best_hdd_cached(required_tb, slots, parity, price_dict):
+    """Cached HDD calculation - critical for performance"""
+    key = (round(required_tb, 2), slots, parity)
+    if key in hdd_cache:
+        return hdd_cache[key]
+
+    best_cfg = _search_hdd_config(required_tb, slots, parity, _price_pairs_sorted(price_dict))
     hdd_cache[key] = best_cfg
     return best_cfg
 
 # ================= OPTIMIZED SOLVER =================
-def solve_combo(flat_cams, nvrs, raid_mode, hdd_prices):
-    """Optimized solver with pruning and early termination"""
-    
-    # Precompute prefix sums for O(1) range queries
-    total_cameras = len(flat_cams)
-    bw_prefix = [0] * (total_cameras + 1)
-    st_prefix = [0] * (total_cameras + 1)
-    
-    for i, (_, mbps, storage) in enumerate(flat_cams):
-        bw_prefix[i + 1] = bw_prefix[i] + mbps
-        st_prefix[i + 1] = st_prefix[i] + storage
-    
+def solve_combo(row_names, cam_index, bw_prefix, st_prefix, nvrs, raid_mode, hdd_prices):
+    """Optimized solver with pruning and early termination.
+
+    Camera data arrives as parallel arrays built once by the caller: the row
+    names stored once, a uint16 index into them per camera, and prefix sums
+    of bandwidth and storage (length len(cam_index) + 1). Every combo shares
+    the same compact buffers and range queries stay O(1).
+    """
+    total_cameras = len(cam_index)
     n_nvrs = len(nvrs)
-    parity = 0 if raid_mode == "JBOD" else (1 if raid_mode == "RAID 5" else 2)
+    parity = RAID_PARITY.get(raid_mode, 2)
     
-    # Pre-calculate minimum possible cost for pruning
-    min_nvr_cost = min(n["Price"] for n in nvrs)
+    # Pre-calculate suffix bounds for pruning: exact NVR cost still to be paid
+    # from each position, and the largest channel count available after it.
+    # Every NVR in the combo takes at least one camera, so the price suffix is
+    # a valid (and tighter) lower bound than min-price * count.
     min_hdd_cost = min(hdd_prices.values())
+    price_after = [0.0] * (n_nvrs + 1)
+    max_ch_after = [0] * (n_nvrs + 1)
+    for i in range(n_nvrs - 1, -1, -1):
+        price_after[i] = price_after[i + 1] + nvrs[i]["Price"]
+        max_ch_after[i] = max(max_ch_after[i + 1], nvrs[i]["CH"])
+
+    # Hoist the fixed per-NVR fields out of the dicts once so the search
+    # does list indexing on locals instead of a dict lookup per access
+    nvr_ch = [n["CH"] for n in nvrs]
+    nvr_mb = [n["MB"] for n in nvrs]
+    nvr_slots = [n["Slots"] for n in nvrs]
+    nvr_price = [n["Price"] for n in nvrs]
     
     best_result = None
     best_cost = float('inf')
@@ -144,7 +207,7 @@ def solve_combo(flat_cams, nvrs, raid_mode, hdd_prices):
         nonlocal best_result, best_cost
         
         # Prune if we can't beat best_cost
-        lower_bound = current_cost + (n_nvrs - idx) * (min_nvr_cost + min_hdd_cost)
+        lower_bound = current_cost + price_after[idx] + (n_nvrs - idx) * min_hdd_cost
         if lower_bound >= best_cost:
             return
         
@@ -156,7 +219,7 @@ def solve_combo(flat_cams, nvrs, raid_mode, hdd_prices):
             if start < total_cameras:
                 end = total_cameras
                 bw = bw_prefix[end] - bw_prefix[start]
-                if bw > nvrs[idx]["MB"]:
+                if bw > nvr_mb[idx]:
                     assignment.pop()
                     return
             
@@ -174,23 +237,24 @@ def solve_combo(flat_cams, nvrs, raid_mode, hdd_prices):
                     st = st_prefix[e] - st_prefix[s]
                     pos = e
                     
-                    if take > nvr["CH"] or bw > nvr["MB"]:
+                    if take > nvr_ch[i] or bw > nvr_mb[i]:
                         valid = False
                         break
-                    
-                    hdd = get_best_hdd_cached(st, nvr["Slots"], parity, hdd_prices)
+
+                    hdd = get_best_hdd_cached(st, nvr_slots[i], parity, hdd_prices)
                     if not hdd:
                         valid = False
                         break
-                    
-                    cost = nvr["Price"] + hdd["cost"]
+
+                    cost = nvr_price[i] + hdd["cost"]
                     total += cost
                     
                     # Count camera types for display
-                    cam_counts = {}
+                    row_counts = {}
                     for j in range(s, e):
-                        name = flat_cams[j][0]
-                        cam_counts[name] = cam_counts.get(name, 0) + 1
+                        r = cam_index[j]
+                        row_counts[r] = row_counts.get(r, 0) + 1
+                    cam_counts = {row_names[r]: c for r, c in row_counts.items()}
                     
                     result.append({
                         "nvr": nvr,
@@ -210,50 +274,39 @@ def solve_combo(flat_cams, nvrs, raid_mode, hdd_prices):
             return
         
         # Calculate realistic range for this NVR
-        nvr = nvrs[idx]
-        
         # Max by channel
-        max_take = min(nvr["CH"], remaining - (n_nvrs - idx - 1))
-        
-        # Max by bandwidth (estimate using prefix sums)
+        max_take = min(nvr_ch[idx], remaining - (n_nvrs - idx - 1))
+
+        # Max by bandwidth: the prefix sums are non-decreasing, so the
+        # largest feasible take is a single bisect over the prefix array
         if start < total_cameras:
-            # Binary search for max cameras this NVR can handle by bandwidth
-            low, high = 1, min(max_take, remaining)
-            max_by_bw = 0
-            while low <= high:
-                mid = (low + high) // 2
-                if start + mid <= total_cameras:
-                    bw = bw_prefix[start + mid] - bw_prefix[start]
-                    if bw <= nvr["MB"]:
-                        max_by_bw = mid
-                        low = mid + 1
-                    else:
-                        high = mid - 1
-                else:
-                    high = mid - 1
-            max_take = min(max_take, max_by_bw)
+            hi = min(start + min(max_take, remaining), total_cameras)
+            cut = bisect_right(bw_prefix, bw_prefix[start] + nvr_mb[idx], start, hi + 1)
+            max_take = min(max_take, cut - 1 - start)
         
         # Min take: at least 1, and leave enough for remaining NVRs
-        min_take = max(1, remaining - (n_nvrs - idx - 1) * max(nvr["CH"] for nvr in nvrs[idx+1:]))
-        min_take = max(min_take, 1)
+        min_take = max(1, remaining - (n_nvrs - idx - 1) * max_ch_after[idx + 1])
         
         if min_take > max_take:
             return
         
         # Try from largest to smallest (finds cheaper solutions faster)
+        slots = nvr_slots[idx]
+        price = nvr_price[idx]
+        tail_bound = price_after[idx + 1] + (n_nvrs - idx - 1) * min_hdd_cost
         for take in range(max_take, min_take - 1, -1):
             # Estimate cost for this branch
             if start + take <= total_cameras:
                 st = st_prefix[start + take] - st_prefix[start]
-                hdd_est = get_best_hdd_cached(st, nvr["Slots"], parity, hdd_prices)
+                hdd_est = get_best_hdd_cached(st, slots, parity, hdd_prices)
                 if hdd_est:
-                    est_cost = current_cost + nvr["Price"] + hdd_est["cost"]
+                    est_cost = current_cost + price + hdd_est["cost"] + tail_bound
                     if est_cost >= best_cost:
                         continue
-            
+
             assignment.append(take)
-            dfs(idx + 1, start + take, remaining - take, 
-                current_cost + nvr["Price"], assignment)
+            dfs(idx + 1, start + take, remaining - take,
+                current_cost + price, assignment)
             assignment.pop()
     
     dfs(0, 0, total_cameras, 0, [])
@@ -305,19 +358,20 @@ def mk_entry(parent, textvariable=None, width=12, font=FONT_MONO, **kw):
     return e
 
 def mk_btn(parent, text, command, style="normal", **kw):
-    colors = {
-        "primary": (ACCENT,   "#000000", ACCENT_D),
-        "danger":  (SURFACE2, RED,       SURFACE3),
-        "ghost":   (SURFACE2, TEXT2,     SURFACE3),
-        "success": (GREEN,    "#000000", "#18a87f"),
-        "normal":  (SURFACE3, TEXT,      BORDER),
-    }
-    bg, fg, abg = colors.get(style, colors["normal"])
+    bg, fg, abg = BTN_COLORS.get(style, BTN_COLORS["normal"])
     return tk.Button(parent, text=text, command=command,
                      bg=bg, fg=fg, activebackground=abg, activeforeground=fg,
                      font=FONT_BTN, relief="flat", bd=0,
                      cursor="hand2", padx=10, pady=5, **kw)
 
+def digits_only(proposed):
+    """validatecommand for integer entries: empty or digits."""
+    return proposed == "" or proposed.isdigit()
+
+def decimal_only(proposed):
+    """validatecommand for price entries: empty or digits with one dot."""
+    return proposed == "" or proposed.replace(".", "", 1).isdigit()
+
 def sep(parent, bg=BORDER, vertical=False):
     if vertical:
         return tk.Frame(parent, bg=bg, width=1)
@@ -338,10 +392,28 @@ class CCTVApp:
         self.nvr_price_vars = {}
         self.progress_window = None
         self.brand_filter = tk.StringVar(value="All")
+        self._manual_combo_names = None
+
+        # Key-level entry validation: bad characters are rejected as typed
+        # instead of surfacing as a parse error on save
+        self.vcmd_int = (self.root.register(digits_only), "%P")
+        self.vcmd_float = (self.root.register(decimal_only), "%P")
         
         # Camera database
         self.camera_db = load_camera_database()
-        
+
+        # Precompute per-camera codec lists and sorted FPS lists once, so the
+        # selection callbacks are plain dict lookups instead of re-sorting on
+        # every dropdown change
+        self.camera_codecs = {}
+        self.camera_fps = {}
+        for name, data in self.camera_db.items():
+            throughputs = data.get("throughputs", {})
+            self.camera_codecs[name] = list(throughputs)
+            for codec, fps_map in throughputs.items():
+                self.camera_fps[(name, codec)] = sorted(
+                    fps_map, key=lambda x: int(x.replace('fps', '')))
+
         # UI Variables for camera entry
         self.selected_camera_type = tk.StringVar(value="All")
         self.selected_resolution = tk.StringVar(value="All")
@@ -365,9 +437,12 @@ class CCTVApp:
         self.camera_types = ["All"] + sorted(types)
         self.resolutions = ["All"] + sorted(resolutions, key=lambda x: [int(n) for n in x.split('x')] if 'x' in x else [0, 0])
         
-        # Bind trace to update Mbps and Storage when selections change
-        self.selected_camera_type.trace('w', self.update_camera_dropdown)
-        self.selected_resolution.trace('w', self.update_camera_dropdown)
+        # Bind trace to update Mbps and Storage when selections change.
+        # Filter changes are coalesced through after_idle so setting type and
+        # resolution together triggers one dropdown rebuild, not two.
+        self._dropdown_update_job = None
+        self.selected_camera_type.trace('w', self._schedule_camera_dropdown_update)
+        self.selected_resolution.trace('w', self._schedule_camera_dropdown_update)
         self.selected_camera.trace('w', self.update_codec_dropdown)
         self.selected_codec.trace('w', self.update_fps_dropdown)
         self.selected_fps.trace('w', self.update_mbps_and_storage)
@@ -452,6 +527,15 @@ class CCTVApp:
         self._build_hdd_tab(self.tabs[3])
 
     # ── Tab 1: Cameras (Database with Type and Resolution Filters) ────────
+    def _schedule_camera_dropdown_update(self, *args):
+        """Coalesce bursts of filter-trace callbacks into one idle rebuild"""
+        if self._dropdown_update_job is None:
+            self._dropdown_update_job = self.root.after_idle(self._run_camera_dropdown_update)
+
+    def _run_camera_dropdown_update(self):
+        self._dropdown_update_job = None
+        self.update_camera_dropdown()
+
     def update_camera_dropdown(self, *args):
         """Update camera dropdown based on selected camera type and resolution"""
         camera_type = self.selected_camera_type.get()
@@ -471,7 +555,10 @@ class CCTVApp:
         
         if filtered_cameras:
             self.camera_dropdown['values'] = filtered_cameras
-            self.selected_camera.set(filtered_cameras[0])
+            # Keep the current pick when it still matches the filters, so a
+            # deferred rebuild never clobbers a selection made meanwhile
+            if self.selected_camera.get() not in filtered_cameras:
+                self.selected_camera.set(filtered_cameras[0])
         else:
             self.camera_dropdown['values'] = ["No cameras found"]
             self.selected_camera.set("")
@@ -480,7 +567,7 @@ class CCTVApp:
         """Update codec dropdown based on selected camera"""
         camera_name = self.selected_camera.get()
         if camera_name and camera_name in self.camera_db:
-            codecs = list(self.camera_db[camera_name].get("throughputs", {}).keys())
+            codecs = self.camera_codecs.get(camera_name, [])
             self.codec_dropdown['values'] = codecs
             if codecs:
                 self.selected_codec.set(codecs[0])
@@ -495,8 +582,7 @@ class CCTVApp:
         camera_name = self.selected_camera.get()
         codec = self.selected_codec.get()
         if camera_name and camera_name in self.camera_db and codec:
-            throughputs = self.camera_db[camera_name].get("throughputs", {}).get(codec, {})
-            fps_list = sorted(throughputs.keys(), key=lambda x: int(x.replace('fps', '')))
+            fps_list = self.camera_fps.get((camera_name, codec), [])
             self.fps_dropdown['values'] = fps_list
             if fps_list:
                 self.selected_fps.set(fps_list[0])
@@ -530,74 +616,72 @@ class CCTVApp:
         except ValueError:
             self.calculated_storage.set("0.00")
     
+    def _validated_camera_row(self):
+        """Read and validate the current database selection.
+
+        Returns (name, qty, mbps, storage_tb), or None when no valid camera
+        model is selected (an error dialog is shown in that case). Raises
+        ValueError for invalid numeric input.
+        """
+        camera_name = self.selected_camera.get()
+        if not camera_name or camera_name == "No cameras found":
+            messagebox.showerror("Error", "Please select a valid camera model.")
+            return None
+
+        quantity = self.camera_quantity.get().strip()
+        if not quantity:
+            raise ValueError("Quantity cannot be empty")
+
+        mbps = float(self.calculated_mbps.get())
+        if mbps <= 0:
+            raise ValueError("Invalid Mbps value")
+
+        storage_tb = float(self.calculated_storage.get())
+        if storage_tb <= 0:
+            raise ValueError("Invalid storage value")
+
+        qty = int(quantity)
+        if qty <= 0:
+            raise ValueError("Quantity must be positive")
+
+        return camera_name, qty, mbps, storage_tb
+
     def add_camera_from_database(self):
         """Add camera to the tree using values from database selection"""
         try:
-            camera_name = self.selected_camera.get()
-            if not camera_name or camera_name == "No cameras found":
-                messagebox.showerror("Error", "Please select a valid camera model.")
-                return
-            
-            quantity = self.camera_quantity.get().strip()
-            if not quantity:
-                raise ValueError("Quantity cannot be empty")
-            
-            mbps = float(self.calculated_mbps.get())
-            if mbps <= 0:
-                raise ValueError("Invalid Mbps value")
-            
-            storage_tb = float(self.calculated_storage.get())
-            if storage_tb <= 0:
-                raise ValueError("Invalid storage value")
-            
-            qty = int(quantity)
-            if qty <= 0:
-                raise ValueError("Quantity must be positive")
-            
-            # Add to tree
-            tag = "even" if len(self.tree.get_children()) % 2 == 0 else "odd"
-            self.tree.insert("", "end", values=(camera_name, qty, f"{mbps:.2f}", f"{storage_tb:.2f}"), tags=(tag,))
-            self.refresh_nvr_dropdowns()
-            
+            row = self._validated_camera_row()
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
-    
+            return
+        if row is None:
+            return
+        camera_name, qty, mbps, storage_tb = row
+
+        # Add to tree
+        tag = "even" if len(self.tree.get_children()) % 2 == 0 else "odd"
+        self.tree.insert("", "end", values=(camera_name, qty, f"{mbps:.2f}", f"{storage_tb:.2f}"), tags=(tag,))
+        self.refresh_nvr_dropdowns()
+
     def update_selected_camera(self):
         """Update the selected camera in the tree with current values"""
         sel = self.tree.selection()
         if not sel:
             messagebox.showwarning("Warning", "Please select a camera to update.")
             return
-        
+
         try:
-            camera_name = self.selected_camera.get()
-            if not camera_name or camera_name == "No cameras found":
-                messagebox.showerror("Error", "Please select a valid camera model.")
-                return
-            
-            quantity = self.camera_quantity.get().strip()
-            if not quantity:
-                raise ValueError("Quantity cannot be empty")
-            
-            mbps = float(self.calculated_mbps.get())
-            if mbps <= 0:
-                raise ValueError("Invalid Mbps value")
-            
-            storage_tb = float(self.calculated_storage.get())
-            if storage_tb <= 0:
-                raise ValueError("Invalid storage value")
-            
-            qty = int(quantity)
-            if qty <= 0:
-                raise ValueError("Quantity must be positive")
-            
-            # Update the selected item
-            tag = "even" if self.tree.index(sel[0]) % 2 == 0 else "odd"
-            self.tree.item(sel[0], values=(camera_name, qty, f"{mbps:.2f}", f"{storage_tb:.2f}"), tags=(tag,))
-            self.refresh_nvr_dropdowns()
-            
+            row = self._validated_camera_row()
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
+            return
+        if row is None:
+            return
+        camera_name, qty, mbps, storage_tb = row
+
+        # Update the selected item
+        tag = "even" if self.tree.index(sel[0]) % 2 == 0 else "odd"
+        self.tree.item(sel[0], values=(camera_name, qty, f"{mbps:.2f}", f"{storage_tb:.2f}"), tags=(tag,))
+        self.refresh_nvr_dropdowns()
     
     def _build_cameras_tab(self, tab):
         tab.columnconfigure(0, weight=1)
@@ -641,12 +725,14 @@ class CCTVApp:
         
         # Row 6: Quantity
         mk_label(db_frame, "Quantity:", bg=SURFACE, fg=TEXT2).grid(row=6, column=0, sticky="w", padx=(14, 5), pady=5)
-        qty_entry = mk_entry(db_frame, textvariable=self.camera_quantity, width=10)
+        qty_entry = mk_entry(db_frame, textvariable=self.camera_quantity, width=10,
+                             validate="key", validatecommand=self.vcmd_int)
         qty_entry.grid(row=6, column=1, sticky="w", padx=(0, 10), pady=5)
         
         # Row 7: Retention Days
         mk_label(db_frame, "Retention Days:", bg=SURFACE, fg=TEXT2).grid(row=7, column=0, sticky="w", padx=(14, 5), pady=5)
-        days_entry = mk_entry(db_frame, textvariable=self.retention_days, width=10)
+        days_entry = mk_entry(db_frame, textvariable=self.retention_days, width=10,
+                              validate="key", validatecommand=self.vcmd_int)
         days_entry.grid(row=7, column=1, sticky="w", padx=(0, 10), pady=5)
         
         # Row 8: Calculated Mbps
@@ -703,8 +789,9 @@ class CCTVApp:
         if vals:
             camera_name = vals[0]
             if camera_name in self.camera_db:
-                cam_type = self.camera_db[camera_name].get("type", "All")
-                cam_res = self.camera_db[camera_name].get("resolution", "All")
+                info = self.camera_db[camera_name]
+                cam_type = info.get("type", "All")
+                cam_res = info.get("resolution", "All")
                 if cam_type in self.camera_types:
                     self.selected_camera_type.set(cam_type)
                 if cam_res in self.resolutions:
@@ -830,6 +917,11 @@ class CCTVApp:
         else:
             filtered_nvrs = [n for n in self.nvr_list if n.get("brand", "") == brand]
         names = ["None"] + [n["Name"] for n in filtered_nvrs]
+        # Called from every camera add/update/delete too - skip the combo
+        # reconfiguration when the name list hasn't actually changed
+        if names == self._manual_combo_names:
+            return
+        self._manual_combo_names = names
         for combo in self.manual_combos:
             current = combo.get()
             combo['values'] = names
@@ -853,7 +945,9 @@ class CCTVApp:
         self.progress_bar = ttk.Progressbar(self.progress_window, mode='indeterminate')
         self.progress_bar.pack(padx=20, pady=10, fill='x')
         self.progress_bar.start(10)
-        self.root.update()
+        # update_idletasks redraws the popup without re-entering the event
+        # loop, so queued user events cannot fire mid-handler
+        self.root.update_idletasks()
 
     def hide_progress(self):
         if self.progress_window and self.progress_window.winfo_exists():
@@ -875,7 +969,14 @@ class CCTVApp:
         for col, (f, w) in enumerate(fields):
             mk_label(add_f, f, bg=SURFACE, fg=TEXT2).grid(row=1, column=col*2, sticky="w", padx=(14 if col==0 else 6, 3))
             var = tk.StringVar()
-            e = mk_entry(add_f, textvariable=var, width=w)
+            if f in ("CH", "MB", "Slots"):
+                e = mk_entry(add_f, textvariable=var, width=w,
+                             validate="key", validatecommand=self.vcmd_int)
+            elif f == "Price":
+                e = mk_entry(add_f, textvariable=var, width=w,
+                             validate="key", validatecommand=self.vcmd_float)
+            else:
+                e = mk_entry(add_f, textvariable=var, width=w)
             e.grid(row=1, column=col*2+1, padx=(0, 2), pady=(0, 10))
             self.nf[f] = var
 
@@ -919,7 +1020,10 @@ class CCTVApp:
         for col, width, anchor in column_configs:
             self.nvr_tree.heading(col, text=col)
             self.nvr_tree.column(col, width=width, anchor=anchor)
-        
+
+        self.nvr_tree.tag_configure("odd", background=SURFACE)
+        self.nvr_tree.tag_configure("even", background=SURFACE2)
+
         vsb = ttk.Scrollbar(list_frame, orient="vertical", command=self.nvr_tree.yview)
         hsb = ttk.Scrollbar(list_frame, orient="horizontal", command=self.nvr_tree.xview)
         self.nvr_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -933,26 +1037,20 @@ class CCTVApp:
         self.refresh_nvr_list_tab()
 
     def refresh_nvr_list_tab(self):
-        for item in self.nvr_tree.get_children():
-            self.nvr_tree.delete(item)
-        
+        self.nvr_tree.delete(*self.nvr_tree.get_children())
+
+        insert = self.nvr_tree.insert
         for i, n in enumerate(self.nvr_list):
-            tag = "even" if i % 2 == 0 else "odd"
-            price_str = f"${n['Price']:,.2f}"
-            
-            self.nvr_tree.insert("", "end", values=(
+            insert("", "end", values=(
                 n["Name"],
                 n["SKU"],
                 n["CH"],
                 n["MB"],
                 n["Slots"],
-                price_str,
+                f"${n['Price']:,.2f}",
                 n.get("mode", "RAID"),
                 n.get("brand", "Tyco - American Dynamics"),
-            ), tags=(tag,))
-        
-        self.nvr_tree.tag_configure("odd", background=SURFACE)
-        self.nvr_tree.tag_configure("even", background=SURFACE2)
+            ), tags=("even" if i % 2 == 0 else "odd",))
 
     def _on_nvr_double_click(self, event):
         item = self.nvr_tree.selection()[0] if self.nvr_tree.selection() else None
@@ -979,7 +1077,8 @@ class CCTVApp:
         mk_label(edit_window, f"Edit price for {values[0]}", font=FONT_H2, fg=ACCENT, bg=SURFACE).pack(pady=(10, 5))
         
         price_var = tk.StringVar(value=f"{current_price:.2f}")
-        price_entry = mk_entry(edit_window, textvariable=price_var, width=15)
+        price_entry = mk_entry(edit_window, textvariable=price_var, width=15,
+                               validate="key", validatecommand=self.vcmd_float)
         price_entry.pack(pady=5)
         
         def save_price():
@@ -992,8 +1091,9 @@ class CCTVApp:
                     if nvr["Name"] == values[0] and nvr["SKU"] == values[1]:
                         self.nvr_list[idx]["Price"] = new_price
                         break
-                
-                self.refresh_nvr_list_tab()
+
+                # Update just the edited cell - no full list rebuild
+                self.nvr_tree.set(item, "Price", f"${new_price:,.2f}")
                 edit_window.destroy()
                 
             except ValueError as e:
@@ -1025,28 +1125,16 @@ class CCTVApp:
 
     def add_new_nvr(self):
         try:
-            name = self.nf["Name"].get().strip()
-            if not name:
-                raise ValueError("Name required")
-            sku = self.nf["SKU"].get().strip()
-            if not sku:
-                raise ValueError("SKU required")
-            ch_str = self.nf["CH"].get().strip()
-            if not ch_str:
-                raise ValueError("Channels required")
-            mb_str = self.nf["MB"].get().strip()
-            if not mb_str:
-                raise ValueError("Max MB/s required")
-            slots_str = self.nf["Slots"].get().strip()
-            if not slots_str:
-                raise ValueError("HDD Slots required")
-            price_str = self.nf["Price"].get().strip()
-            if not price_str:
-                raise ValueError("Price required")
+            # Read and validate all fields in one pass
+            raw = {f: var.get().strip() for f, var in self.nf.items()}
+            for f, label in NVR_FIELD_LABELS.items():
+                if not raw[f]:
+                    raise ValueError(f"{label} required")
 
             row = {
-                "Name": name, "SKU": sku, "CH": int(ch_str), "MB": int(mb_str),
-                "Slots": int(slots_str), "Price": float(price_str),
+                "Name": raw["Name"], "SKU": raw["SKU"],
+                "CH": int(raw["CH"]), "MB": int(raw["MB"]),
+                "Slots": int(raw["Slots"]), "Price": float(raw["Price"]),
                 "mode": self.na.get(), "brand": self.nf_brand.get(),
             }
 
@@ -1056,8 +1144,14 @@ class CCTVApp:
             self.nvr_list.append(row)
             self.save_all_data()
             self.refresh_nvr_dropdowns()
-            self.refresh_nvr_list_tab()
-            
+
+            # Append the one new row instead of rebuilding the whole tree
+            i = len(self.nvr_list) - 1
+            self.nvr_tree.insert("", "end", values=(
+                row["Name"], row["SKU"], row["CH"], row["MB"], row["Slots"],
+                f"${row['Price']:,.2f}", row["mode"], row["brand"],
+            ), tags=("even" if i % 2 == 0 else "odd",))
+
             for f in self.nf.values():
                 f.set("")
             self.na.set("RAID")
@@ -1086,7 +1180,8 @@ class CCTVApp:
             mk_label(grid, f"{cap} TB", fg=TEXT2, bg=SURFACE, width=6).grid(
                 row=row, column=col, sticky="w", padx=(0, 4), pady=5)
             var = tk.StringVar(value=f"{self.hdd_prices[cap]:.2f}")
-            e = mk_entry(grid, textvariable=var, width=10)
+            e = mk_entry(grid, textvariable=var, width=10,
+                         validate="key", validatecommand=self.vcmd_float)
             e.grid(row=row, column=col+1, padx=(0, 24), pady=5)
             self.hdd_ents[cap] = var
 
@@ -1104,6 +1199,9 @@ class CCTVApp:
             except ValueError as e:
                 messagebox.showerror("Error", f"Invalid price for {cap}TB: {e}")
                 return
+        # The HDD cache is keyed on (tb, slots, parity) only - entries
+        # computed with the old prices would be stale after an edit
+        hdd_cache.clear()
         self.save_all_data()
         messagebox.showinfo("Saved", "HDD Prices Updated.")
 
@@ -1143,7 +1241,7 @@ class CCTVApp:
         
         if not result:
             self.calc_status.config(text="No solution found", fg=RED)
-            self._show_result_error("ERROR: No valid configuration found.\n\nPossible reasons:\n• HDD sizes cannot meet storage requirements\n• NVR channel/slot limits exceeded\n• No compatible NVRs available for selected RAID mode")
+            self._show_result_error(NO_SOLUTION_MSG)
             return
         
         self.last_calculation_result = {
@@ -1176,15 +1274,25 @@ class CCTVApp:
             compatible_nvrs = available_nvrs
         
         compatible_nvrs = self.filter_dominated_nvrs(compatible_nvrs)
-        
-        flat_cams = []
-        for name, count, mbps, storage in cameras:
+
+        # Build the camera data once as parallel prefix-sum arrays so every
+        # combo shares the same buffers. Row names are stored once with a
+        # uint16 index per camera, and the prefix sums live in C-contiguous
+        # double arrays - far less to hold and to pickle per worker task
+        # than one tuple per camera.
+        row_names = [c[0] for c in cameras]
+        cam_index = array("H")
+        bw_prefix = array("d", [0.0])
+        st_prefix = array("d", [0.0])
+        for r, (name, count, mbps, storage) in enumerate(cameras):
             for _ in range(count):
-                flat_cams.append((name, mbps, storage))
-        
-        total_cam = len(flat_cams)
-        total_bw = sum(x[1] for x in flat_cams)
-        
+                cam_index.append(r)
+                bw_prefix.append(bw_prefix[-1] + mbps)
+                st_prefix.append(st_prefix[-1] + storage)
+
+        total_cam = len(cam_index)
+        total_bw = bw_prefix[-1]
+
         combos_to_test = []
         for k in range(1, min(5, len(compatible_nvrs) + 2)):
             for combo in itertools.combinations_with_replacement(compatible_nvrs, k):
@@ -1192,7 +1300,7 @@ class CCTVApp:
                     continue
                 if sum(n["MB"] for n in combo) < total_bw:
                     continue
-                combos_to_test.append((flat_cams.copy(), list(combo), raid_mode, self.hdd_prices))
+                combos_to_test.append((row_names, cam_index, bw_prefix, st_prefix, list(combo), raid_mode, self.hdd_prices))
         
         if not combos_to_test:
             return None
@@ -1215,11 +1323,15 @@ class CCTVApp:
         return best_result
     def manual_calculate(self, cameras):
         """Manual calculation - uses user-selected NVRs"""
+        # Index once by name instead of a linear scan per dropdown; reversed
+        # so the first occurrence of a duplicated name wins, as before
+        nvr_by_name = {n["Name"]: n for n in reversed(self.nvr_list)}
+
         selected_nvrs = []
         for combo in self.manual_combos:
             nvr_name = combo.get()
             if nvr_name != "None" and nvr_name:
-                nvr = next((n for n in self.nvr_list if n["Name"] == nvr_name), None)
+                nvr = nvr_by_name.get(nvr_name)
                 if nvr:
                     selected_nvrs.append(nvr)
         
@@ -1245,13 +1357,7 @@ class CCTVApp:
             messagebox.showwarning("Warning", f"Selected NVRs have only {total_bandwidth_capacity} Mbps bandwidth, but you need {total_bandwidth:.1f} Mbps.")
             return None
         
-        # Flatten cameras
-        flat_cams = []
-        for name, count, mbps, storage in cameras:
-            for _ in range(count):
-                flat_cams.append((name, mbps, storage))
-        
-        # Use the distribution function
+        # Use the distribution function (it flattens the cameras itself)
         return self.distribute_cameras_simple(cameras, selected_nvrs)
         
     def distribute_cameras_simple(self, cameras, nvrs):
@@ -1277,8 +1383,9 @@ class CCTVApp:
             if remaining <= 0:
                 break
             
-            # Calculate average bandwidth of remaining cameras
-            avg_bandwidth = sum(c[1] for c in flat_cams[:remaining]) / remaining if remaining > 0 else 0
+            # Calculate average bandwidth of remaining cameras - islice avoids
+            # materializing a slice copy per NVR
+            avg_bandwidth = sum(c[1] for c in itertools.islice(flat_cams, remaining)) / remaining if remaining > 0 else 0
             max_by_bandwidth = int(nvr["MB"] / avg_bandwidth) if avg_bandwidth > 0 else nvr["CH"]
             max_for_nvr = min(nvr["CH"], max_by_bandwidth, remaining)
             
@@ -1303,7 +1410,7 @@ class CCTVApp:
         result = []
         idx = 0
         raid_mode = self.raid_var.get()
-        parity = 0 if raid_mode == "JBOD" else (1 if raid_mode == "RAID 5" else 2)
+        parity = RAID_PARITY.get(raid_mode, 2)
         
         for i, nvr in enumerate(nvrs):
             take = target_cams[i]
@@ -1312,24 +1419,25 @@ class CCTVApp:
             
             cam_slice = flat_cams[idx:idx + take]
             idx += take
-            
-            total_storage = sum(c[2] for c in cam_slice)
-            total_bandwidth = sum(c[1] for c in cam_slice)
-            
+
+            # Single pass over the slice: totals and per-type counts together
+            total_storage = 0.0
+            total_bandwidth = 0.0
+            cam_counts = {}
+            for cname, mbps, storage in cam_slice:
+                total_bandwidth += mbps
+                total_storage += storage
+                cam_counts[cname] = cam_counts.get(cname, 0) + 1
+
             # Check bandwidth limit
             if total_bandwidth > nvr["MB"]:
                 return None
-            
+
             # Get HDD configuration
             hdd = get_best_hdd_cached(total_storage, nvr["Slots"], parity, self.hdd_prices)
             if hdd is None:
                 return None
             
-            # Count camera types
-            cam_counts = {}
-            for c in cam_slice:
-                cam_counts[c[0]] = cam_counts.get(c[0], 0) + 1
-            
             result.append({
                 "nvr": nvr,
                 "cameras": cam_slice,
@@ -1344,43 +1452,50 @@ class CCTVApp:
         return result if idx == total_cams else None
     
     def filter_dominated_nvrs(self, nvrs):
-        filtered = []
-        for i, a in enumerate(nvrs):
-            dominated = False
-            for j, b in enumerate(nvrs):
-                if i == j:
-                    continue
-                if (b["CH"] >= a["CH"] and 
-                    b["MB"] >= a["MB"] and 
-                    b["Slots"] >= a["Slots"] and
-                    b["Price"] <= a["Price"]):
-                    dominated = True
-                    break
-            if not dominated:
-                filtered.append(a)
-        return filtered
+        # The dominance check is a pure function of the NVR specs, and the
+        # model list rarely changes between runs - memoize the kept indices.
+        key = tuple((n["CH"], n["MB"], n["Slots"], n["Price"]) for n in nvrs)
+        kept = dominance_cache.get(key)
+        if kept is None:
+            kept = []
+            for i, a in enumerate(key):
+                dominated = False
+                for j, b in enumerate(key):
+                    if i == j:
+                        continue
+                    if (b[0] >= a[0] and
+                        b[1] >= a[1] and
+                        b[2] >= a[2] and
+                        b[3] <= a[3]):
+                        dominated = True
+                        break
+                if not dominated:
+                    kept.append(i)
+            dominance_cache[key] = kept
+        return [nvrs[i] for i in kept]
 
     def display_results(self, result):
         now = datetime.now().strftime("%Y-%m-%d %H:%M")
         total = sum(u["cost"] for u in result)
+        raid_mode = self.raid_var.get()  # one Tcl read, not one per unit
         lines = []
 
         def write(text, tag="value"):
             lines.append((text, tag))
 
-        write("=" * 72 + "\n", "divider")
+        write(SEP72, "divider")
         write(f" CCTV DESIGN REPORT  —  {now}\n", "header")
         write(f" SYSTEM TOTAL: ${total:,.2f}\n", "cost")
-        write("=" * 72 + "\n", "divider")
+        write(SEP72, "divider")
 
         for i, u in enumerate(result, 1):
             nvr = u["nvr"]
             hdd = u["hdd_config"]
             write(f"\nUNIT #{i}: {nvr['Name']}\n", "best")
-            write("-" * 50 + "\n", "divider")
-            write(f"  Mode:     ", "label")
-            write(f"{self.raid_var.get()}\n", "value")
-            write(f"  Load:     ", "label")
+            write(DASH50, "divider")
+            write("  Mode:     ", "label")
+            write(f"{raid_mode}\n", "value")
+            write("  Load:     ", "label")
             
             mbps_total = u["total_bandwidth"]
             mbps_capacity = nvr["MB"]
@@ -1388,54 +1503,56 @@ class CCTVApp:
             
             write(f"{mbps_total:.1f} Mbps  ({load_pct:.1f}% of {nvr['MB']} Mbps capacity)\n", "value")
             
-            write(f"  Cameras:  ", "label")
+            write("  Cameras:  ", "label")
             write(f"{u['camera_count']} total  ", "value")
             if u.get("cam_breakdown"):
                 parts = ",  ".join(f"{n}: {c}" for n, c in u["cam_breakdown"].items())
                 write(f"({parts})\n", "value")
             else:
                 write("\n", "value")
-            write(f"  Storage:  ", "label")
+            write("  Storage:  ", "label")
             drive_str = f"{hdd['qty']} × {hdd['cap']} TB"
             total_cap = hdd['qty'] * hdd['cap']
             usable_tb = hdd['data'] * hdd['cap']
             write(f"{drive_str}  = {total_cap:.1f} TB  ", "value")
             write(f"(usable: {usable_tb:.1f} TB)\n", "label")
-            write(f"  Cost:     ", "label")
+            write("  Cost:     ", "label")
             write(f"NVR ${nvr['Price']:,.2f}  +  HDD ${hdd['cost']:,.2f}  =  ${u['cost']:,.2f}\n", "cost")
 
-        write("\n" + "=" * 72 + "\n", "divider")
+        write("\n" + SEP72, "divider")
         write(f" GRAND TOTAL:  ${total:,.2f}\n", "cost")
-        write("=" * 72 + "\n", "divider")
+        write(SEP72, "divider")
 
-        self.res_txt.config(state="normal")
-        self.res_txt.delete("1.0", "end")
+        # Flatten to the chars/tag chain form Text.insert accepts, so the
+        # whole report lands in a single Tcl call instead of one per line
+        chunks = []
         for text, tag in lines:
-            self.res_txt.insert("end", text, tag)
+            chunks.append(text)
+            chunks.append(tag)
+
+        self.res_txt.config(state="normal")
+        self.res_txt.replace("1.0", "end", *chunks)
         self.res_txt.config(state="disabled")
 
-        self.last_report = "".join(t for t, _ in lines)
+        self.last_report = "".join(chunks[::2])
         self.nb.select(self.tabs[1])
 
     def _show_result_error(self, msg):
         self.res_txt.config(state="normal")
-        self.res_txt.delete("1.0", "end")
-        self.res_txt.insert("end", msg, "error")
+        self.res_txt.replace("1.0", "end", msg, "error")
         self.res_txt.config(state="disabled")
 
     # ── PDF Export ──────────────────────────────────────────────────────────
     def export_to_pdf(self):
         """Export calculation results to PDF (without prices)"""
         if not self.last_calculation_result:
-            messagebox.showwarning("Warning", "Run a calculation first before exporting!")
+            messagebox.showwarning("Warning", EXPORT_FIRST_MSG)
             return
         
         if not PDF_AVAILABLE:
-            messagebox.showerror("Error", 
-                "PDF export requires reportlab library.\n\n"
-                "Please install it using:\npip install reportlab")
+            messagebox.showerror("Error", PDF_MISSING_MSG)
             return
-        
+
         # Ask for save location
         pdf_file = filedialog.asksaveasfilename(
             title="Save PDF Report",
@@ -1456,137 +1573,156 @@ class CCTVApp:
         progress_msg.grab_set()
         mk_label(progress_msg, "Generating PDF...",
                 font=FONT_H2, fg=ACCENT, bg=SURFACE).pack(pady=(20, 10))
-        self.root.update()
+        self.root.update_idletasks()
+
+        # Build the document off the Tk thread (same pattern as run_logic)
+        # so a large report cannot freeze the UI; completion is marshalled
+        # back with after(). The worker touches plain data only.
+        result = self.last_calculation_result
+
+        def finish(error=None):
+            progress_msg.destroy()
+            if error is None:
+                messagebox.showinfo("Success", f"PDF report saved to:\n{pdf_file}")
+            else:
+                messagebox.showerror("Error", f"Failed to create PDF:\n{error}")
+
+        def worker():
+            try:
+                self._build_pdf_document(pdf_file, result)
+                self.root.after(0, finish)
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                self.root.after(0, lambda err=str(e): finish(err))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _build_pdf_document(self, pdf_file, result):
+        """Build and write the PDF report. Pure reportlab - no Tk calls - so
+        it is safe to run from a worker thread."""
+        # Deferred import - only the first export pays for it, off the UI thread
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+
+        # Create PDF document
+        doc = SimpleDocTemplate(pdf_file, pagesize=landscape(letter),
+                               rightMargin=36, leftMargin=36,
+                               topMargin=72, bottomMargin=72)
+        
+        styles = getSampleStyleSheet()
+        title_style = styles['Title']
+        heading_style = styles['Heading2']
+        normal_style = styles['Normal']
+        
+        # Create a custom style for wrapped text
+        wrapped_style = ParagraphStyle(
+            'WrappedStyle',
+            parent=styles['Normal'],
+            fontSize=9,
+            leading=11,
+            wordWrap='CJK'
+        )
         
-        try:
-            # Create PDF document
-            doc = SimpleDocTemplate(pdf_file, pagesize=landscape(letter),
-                                   rightMargin=36, leftMargin=36,
-                                   topMargin=72, bottomMargin=72)
-            
-            styles = getSampleStyleSheet()
-            title_style = styles['Title']
-            heading_style = styles['Heading2']
-            normal_style = styles['Normal']
-            
-            # Create a custom style for wrapped text
-            wrapped_style = ParagraphStyle(
-                'WrappedStyle',
-                parent=styles['Normal'],
-                fontSize=9,
-                leading=11,
-                wordWrap='CJK'
-            )
-            
-            story = []
-            
-            # Title
-            story.append(Paragraph("CCTV Design Report", title_style))
-            story.append(Spacer(1, 0.25 * inch))
-            story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
-            story.append(Spacer(1, 0.3 * inch))
-            
-            # Camera List
-            story.append(Paragraph("Camera List", heading_style))
-            story.append(Spacer(1, 0.1 * inch))
-            
-            camera_data = [["Camera Name", "Qty", "Mbps", "Storage (TB)"]]
-            for cam in self.last_calculation_result["cameras"]:
-                camera_name = Paragraph(str(cam[0]), wrapped_style)
-                quantity = str(cam[1])
-                
-                try:
-                    mbps_val = float(cam[2])
-                    mbps_str = f"{mbps_val:.2f}"
-                except (ValueError, TypeError):
-                    mbps_str = str(cam[2])
-                
-                try:
-                    storage_val = float(cam[3])
-                    storage_str = f"{storage_val:.2f}"
-                except (ValueError, TypeError):
-                    storage_str = str(cam[3])
-                
-                camera_data.append([camera_name, quantity, mbps_str, storage_str])
+        story = []
+        
+        # Title
+        story.append(Paragraph("CCTV Design Report", title_style))
+        story.append(Spacer(1, 0.25 * inch))
+        story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
+        story.append(Spacer(1, 0.3 * inch))
+        
+        # Camera List
+        story.append(Paragraph("Camera List", heading_style))
+        story.append(Spacer(1, 0.1 * inch))
+        
+        # Both tables share the same look - build the style once
+        table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ])
+
+        camera_data = [["Camera Name", "Qty", "Mbps", "Storage (TB)"]]
+        for cam in result["cameras"]:
+            camera_name = Paragraph(str(cam[0]), wrapped_style)
+            quantity = str(cam[1])
             
-            camera_table = Table(camera_data, colWidths=[3.2*inch, 0.5*inch, 0.7*inch, 0.9*inch])
-            camera_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
-            story.append(camera_table)
-            story.append(Spacer(1, 0.3 * inch))
+            try:
+                mbps_val = float(cam[2])
+                mbps_str = f"{mbps_val:.2f}"
+            except (ValueError, TypeError):
+                mbps_str = str(cam[2])
             
-            # NVR Configuration (without prices)
-            story.append(Paragraph("NVR Configuration", heading_style))
-            story.append(Spacer(1, 0.1 * inch))
+            try:
+                storage_val = float(cam[3])
+                storage_str = f"{storage_val:.2f}"
+            except (ValueError, TypeError):
+                storage_str = str(cam[3])
             
-            nvr_data = [["Unit", "NVR Model", "Cameras", "Bandwidth", "Storage"]]
-            for i, unit in enumerate(self.last_calculation_result["nvr_config"], 1):
-                nvr = unit["nvr"]
-                hdd = unit["hdd_config"]
-                
-                nvr_name = Paragraph(str(nvr["Name"]), wrapped_style)
-                unit_num = str(i)
-                camera_count = str(unit["camera_count"])
-                
-                try:
-                    bw_val = float(unit["total_bandwidth"])
-                    bw_str = f"{bw_val:.1f} Mbps"
-                except (ValueError, TypeError):
-                    bw_str = str(unit["total_bandwidth"])
-                
-                try:
-                    hdd_qty = int(hdd["qty"])
-                    hdd_cap = float(hdd["cap"])
-                    storage_str = f"{hdd_qty} x {hdd_cap:.0f} TB"
-                except (ValueError, TypeError):
-                    storage_str = str(hdd.get("qty", "?")) + " x " + str(hdd.get("cap", "?")) + " TB"
-                
-                nvr_data.append([unit_num, nvr_name, camera_count, bw_str, storage_str])
+            camera_data.append([camera_name, quantity, mbps_str, storage_str])
+        
+        camera_table = Table(camera_data, colWidths=[3.2*inch, 0.5*inch, 0.7*inch, 0.9*inch])
+        camera_table.setStyle(table_style)
+        story.append(camera_table)
+        story.append(Spacer(1, 0.3 * inch))
+        
+        # NVR Configuration (without prices)
+        story.append(Paragraph("NVR Configuration", heading_style))
+        story.append(Spacer(1, 0.1 * inch))
+        
+        nvr_data = [["Unit", "NVR Model", "Cameras", "Bandwidth", "Storage"]]
+        for i, unit in enumerate(result["nvr_config"], 1):
+            nvr = unit["nvr"]
+            hdd = unit["hdd_config"]
             
-            nvr_table = Table(nvr_data, colWidths=[0.5*inch, 3*inch, 0.7*inch, 1.2*inch, 1.2*inch])
-            nvr_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
-            story.append(nvr_table)
+            nvr_name = Paragraph(str(nvr["Name"]), wrapped_style)
+            unit_num = str(i)
+            camera_count = str(unit["camera_count"])
             
-            # Build PDF
-            doc.build(story)
+            try:
+                bw_val = float(unit["total_bandwidth"])
+                bw_str = f"{bw_val:.1f} Mbps"
+            except (ValueError, TypeError):
+                bw_str = str(unit["total_bandwidth"])
             
-            progress_msg.destroy()
-            messagebox.showinfo("Success", f"PDF report saved to:\n{pdf_file}")
+            try:
+                hdd_qty = int(hdd["qty"])
+                hdd_cap = float(hdd["cap"])
+                storage_str = f"{hdd_qty} x {hdd_cap:.0f} TB"
+            except (ValueError, TypeError):
+                storage_str = str(hdd.get("qty", "?")) + " x " + str(hdd.get("cap", "?")) + " TB"
             
-        except Exception as e:
-            progress_msg.destroy()
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Failed to create PDF:\n{str(e)}")
+            nvr_data.append([unit_num, nvr_name, camera_count, bw_str, storage_str])
+        
+        nvr_table = Table(nvr_data, colWidths=[0.5*inch, 3*inch, 0.7*inch, 1.2*inch, 1.2*inch])
+        nvr_table.setStyle(table_style)
+        story.append(nvr_table)
+        
+        # Build PDF
+        doc.build(story)
 
     # ── Excel Export ──────────────────────────────────────────────────────
     def export_to_excel(self):
         if not self.last_calculation_result:
-            messagebox.showwarning("Warning", "Run a calculation first before exporting!")
+            messagebox.showwarning("Warning", EXPORT_FIRST_MSG)
             return
         if not EXCEL_AVAILABLE:
-            messagebox.showerror("Error", "Excel export requires xlwings.\nInstall: pip install xlwings")
+            messagebox.showerror("Error", EXCEL_MISSING_MSG)
             return
 
+        # Deferred import - only the first export pays for it
+        import xlwings as xw
+
         template_file = filedialog.askopenfilename(
             title="Select Excel Template",
             filetypes=[("Excel files", "*.xlsx")])
@@ -1611,7 +1747,7 @@ class CCTVApp:
         progress_msg.grab_set()
         mk_label(progress_msg, "Exporting to Excel...",
                 font=FONT_H2, fg=ACCENT, bg=SURFACE).pack(pady=(20, 10))
-        self.root.update()
+        self.root.update_idletasks()
 
         app = None
         wb = None
@@ -1663,8 +1799,9 @@ class CCTVApp:
             for i, cam in enumerate(cameras):
                 cam_name = cam[0]
                 cam_qty = int(cam[1])
-                cam_sku = self.camera_db.get(cam_name, {}).get("sku", cam_name)
-                cam_brand = self.camera_db.get(cam_name, {}).get("brand", "")
+                cam_info = self.camera_db.get(cam_name, {})
+                cam_sku = cam_info.get("sku", cam_name)
+                cam_brand = cam_info.get("brand", "")
                 excel_rows.append((cam_sku, cam_qty, "", cam_brand, "CCTV", "Camera", "data", "", None))
                 
                 if has_exacq:
@@ -1718,7 +1855,7 @@ class CCTVApp:
                         ws.range(f"G{current_row}").value = header_text
                     try:
                         ws.range(f"A{current_row}:M{current_row}").api.Style = "CG - Header 1"
-                    except:
+                    except Exception:
                         pass
                 else:
                     if part_no:
@@ -1757,7 +1894,7 @@ class CCTVApp:
             if app:
                 try:
                     app.quit()
-                except:
+                except Exception:
                     pass
             messagebox.showerror("Error", f"Export failed: {str(e)}")
 